@@ -2,10 +2,9 @@ import logging
 import re
 import json
 
-import requests
 from bs4 import BeautifulSoup
 
-from utils.user_agents import get_random_user_agent
+from utils.http_transport import HttpTransport
 
 BASE_URL = 'https://de.wikipedia.org/wiki/'
 
@@ -28,15 +27,13 @@ def _get_value_from_table(soup, key: str) -> int:
     return 0
 
 class WikipediaCrawler:
-    def __init__(self, session: requests.Session):
-        self.session = session
+    def __init__(self, transport: HttpTransport):
+        self.transport = transport
 
     def crawl(self, city: str, url: str) -> str:
         """Crawl data for a city from Wikipedia."""
-        self.session.headers.update({'User-Agent': get_random_user_agent()})
-
         logging.info("Crawling data for '%s' from '%s'", city, BASE_URL + url)
-        response = self.session.get(BASE_URL + url)
+        response = self.transport.get(BASE_URL + url)
 
         if response.status_code == 200:
             soup = BeautifulSoup(response.content, 'html.parser')
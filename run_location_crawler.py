@@ -8,10 +8,8 @@ import random
 from dataclasses import dataclass
 from datetime import datetime
 
-
-import requests
-
 from crawlers.wikipedia import WikipediaCrawler
+from utils.http_transport import HttpTransport
 from utils.time_format import split_seconds_into_hours_minutes_and_seconds as time_string
 
 # Constants
@@ -97,10 +95,8 @@ def idle_to_hide_crawling_bot(config: ConfigHandler):
     time.sleep(time_to_idle)
 
 
-def crawl_wikipedia(session: requests.Session, name: str, url: str):
+def crawl_wikipedia(crawler: WikipediaCrawler, name: str, url: str):
     """Crawl data for a single location from Wikipedia."""
-    crawler = WikipediaCrawler(session)
-
     try:
         return crawler.crawl(name, url)
     except Exception as e:
@@ -133,16 +129,18 @@ def save_crawled_data(crawled_data: list):
     logging.info("Crawled location data saved to '%s'.", file_path)
 
 
-def crawl_locations(session: requests.Session, config: ConfigHandler):
+def crawl_locations(transport: HttpTransport, config: ConfigHandler):
     """Crawl data from Wikipedia for all locations defined in the config."""
     crawling_durations = []
     crawled_data = []
 
+    crawler = WikipediaCrawler(transport)
+
     random.shuffle(config.locations)
     for location in config.locations:
         start_time = time.time()
 
-        location_data = crawl_wikipedia(session, location.name, location.wikipedia)
+        location_data = crawl_wikipedia(crawler, location.name, location.wikipedia)
         if location_data:
             crawled_data.append(json.loads(location_data))
 
@@ -153,15 +151,16 @@ def crawl_locations(session: requests.Session, config: ConfigHandler):
 
         log_crawling_progress(crawling_durations, config)
 
+    transport.log_stats()
     save_crawled_data(crawled_data)
 
 
 def main():
     """Main function to load config and start crawling."""
     current_config = ConfigHandler(CONFIG_FILE_NAME)
-    current_session = requests.Session()
 
-    crawl_locations(current_session, current_config)
+    with HttpTransport() as current_transport:
+        crawl_locations(current_transport, current_config)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,306 @@
+import os
+import glob
+import logging
+import json
+import csv
+import time
+import argparse
+from datetime import datetime
+
+import numpy as np
+
+# Parquet export requires pyarrow ('pyarrow' in requirements.txt)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Constants
+DATA_DIR_NAME = 'data'
+TEAM_DIR_NAME = 'teams'
+LOCATION_DIR_NAME = 'locations'
+REPORT_DIR_NAME = 'reports'
+CONFIG_FILE_NAME = 'config.json'
+SNAPSHOT_DATE_FORMAT = '%Y%m%d'
+
+TEAM_COLUMNS = ['name', 'sport', 'league', 'division', 'location']
+REPORT_COLUMNS = [
+    'date', 'name', 'sport', 'league', 'division', 'location',
+    'follower', 'population', 'population_density', 'followers_per_1k_inhabitants',
+    'league_rank', 'division_rank', 'follower_growth', 'follower_growth_per_day'
+]
+INTEGER_COLUMNS = ['follower', 'league_rank', 'division_rank']
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+def get_path(*parts: str) -> str:
+    """Return the absolute path of a file or directory relative to this script."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(script_dir, *parts)
+
+
+def list_snapshots(dir_name: str, kind: str) -> list:
+    """List all crawl snapshots of a kind together with their date."""
+    pattern = get_path(DATA_DIR_NAME, dir_name, f"*_{kind}_crawl.json")
+    snapshots = []
+
+    for file_path in sorted(glob.glob(pattern)):
+        date_string = os.path.basename(file_path).split('_')[0]
+        try:
+            snapshot_date = datetime.strptime(date_string, SNAPSHOT_DATE_FORMAT).date()
+        except ValueError:
+            logging.warning("Snapshot '%s' has no valid date prefix - skipped.", file_path)
+            continue
+        snapshots.append((np.datetime64(snapshot_date, 'D'), file_path))
+
+    logging.info("Found %s %s snapshots.", len(snapshots), kind)
+    return snapshots
+
+
+def load_team_metadata(file_name: str) -> dict:
+    """Load the team metadata (sport, league, ...) from the config by team name."""
+    with open(get_path(file_name), 'r', encoding='utf-8') as file:
+        config = json.load(file)
+
+    return {team.get('name'): team for team in config.get('teams', [])}
+
+
+def normalize_team_entry(entry, team_metadata: dict) -> dict:
+    """Return a team entry of a snapshot as dictionary.
+
+    run_team_crawler saves '[name, instagram_result]' pairs, which are completed
+    with the team metadata from the config.
+    """
+    if isinstance(entry, list):
+        name, instagram = entry
+        return dict(team_metadata.get(name, {}), name=name, instagram=instagram)
+    return entry
+
+
+def load_teams(snapshots: list, team_metadata: dict) -> dict:
+    """Load all team snapshots into columnar arrays."""
+    values = {column: [] for column in ['date', 'follower'] + TEAM_COLUMNS}
+
+    for snapshot_date, file_path in snapshots:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            entries = json.load(file)
+
+        for entry in entries:
+            team = normalize_team_entry(entry, team_metadata)
+            values['date'].append(snapshot_date)
+            # Failed crawls are stored with 0 followers and count as missing
+            values['follower'].append((team.get('instagram') or {}).get('follower') or np.nan)
+            for column in TEAM_COLUMNS:
+                values[column].append(team.get(column) or '')
+
+    teams = {column: np.array(values[column], dtype=str) for column in TEAM_COLUMNS}
+    teams['date'] = np.array(values['date'], dtype='datetime64[D]')
+    teams['follower'] = np.array(values['follower'], dtype=np.float64)
+    return teams
+
+
+def load_locations(snapshots: list) -> dict:
+    """Load the latest non-empty value of each location into columnar arrays.
+
+    The returned 'index' maps each location name to its row in the arrays.
+    """
+    latest = {}
+    for _, file_path in snapshots:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for location in json.load(file):
+                # Failed crawls are stored with a population of 0
+                if location.get('population'):
+                    latest[location['name']] = location
+
+    names = list(latest)
+    return {
+        'name': np.array(names, dtype=str),
+        'population': np.array([latest[name]['population'] for name in names],
+                                dtype=np.float64),
+        'population_density': np.array([latest[name].get('population_density') or np.nan
+                                            for name in names],
+                                        dtype=np.float64),
+        'index': {name: row for row, name in enumerate(names)}
+    }
+
+
+def join_locations(teams: dict, locations: dict) -> dict:
+    """Join the location columns to the teams by 'Team.location'."""
+    # Look up each distinct location once and scatter the result back to all rows
+    unique_locations, inverse = np.unique(teams['location'], return_inverse=True)
+    unique_rows = np.array([locations['index'].get(location, -1)
+                                for location in unique_locations],
+                            dtype=np.int64)
+    rows = unique_rows[inverse.reshape(-1)]
+    matched = rows >= 0
+
+    # Teams without a location (e.g. leagues) are not reported as missing
+    missing_locations = unique_locations[(unique_rows < 0) & (unique_locations != '')]
+    if missing_locations.size:
+        logging.warning("No location data found for: %s", missing_locations.tolist())
+
+    for column in ['population', 'population_density']:
+        joined = np.full(rows.shape, np.nan)
+        joined[matched] = locations[column][rows[matched]]
+        teams[column] = joined
+
+    return teams
+
+
+def rank_within_groups(values: np.ndarray, *keys: np.ndarray) -> np.ndarray:
+    """Rank values in descending order within the groups formed by the keys.
+
+    Equal values share the same rank (1, 1, 3) and missing values are not ranked.
+    """
+    ranks = np.full(values.shape[0], np.nan)
+    valid_rows = np.flatnonzero(~np.isnan(values))
+    values = values[valid_rows]
+    count = values.shape[0]
+    codes = [np.unique(key[valid_rows], return_inverse=True)[1].reshape(-1) for key in keys]
+
+    # np.lexsort uses the last key as primary sort key
+    order = np.lexsort((-values,) + tuple(reversed(codes)))
+
+    same_as_previous = np.zeros(count, dtype=bool)
+    same_as_previous[1:] = True
+    for code in codes:
+        sorted_code = code[order]
+        same_as_previous[1:] &= sorted_code[1:] == sorted_code[:-1]
+    is_group_start = ~same_as_previous
+
+    sorted_values = values[order]
+    is_rank_start = is_group_start.copy()
+    is_rank_start[1:] |= sorted_values[1:] != sorted_values[:-1]
+
+    positions = np.arange(count)
+    group_starts = np.maximum.accumulate(np.where(is_group_start, positions, 0))
+    rank_starts = np.maximum.accumulate(np.where(is_rank_start, positions, 0))
+
+    ranks[valid_rows[order]] = rank_starts - group_starts + 1
+    return ranks
+
+
+def compute_growth(teams: dict) -> dict:
+    """Compute the follower growth of each team since its previous snapshot."""
+    count = teams['follower'].shape[0]
+    team_codes = np.unique(teams['name'], return_inverse=True)[1].reshape(-1)
+    order = np.lexsort((teams['date'], team_codes))
+
+    sorted_codes = team_codes[order]
+    sorted_follower = teams['follower'][order]
+    sorted_days = teams['date'][order].astype(np.int64)
+
+    has_previous = np.zeros(count, dtype=bool)
+    has_previous[1:] = sorted_codes[1:] == sorted_codes[:-1]
+
+    growth = np.full(count, np.nan)
+    days = np.zeros(count, dtype=np.int64)
+    growth[1:] = np.diff(sorted_follower)
+    days[1:] = np.diff(sorted_days)
+    growth[~has_previous] = np.nan
+    days[~has_previous] = 0
+
+    growth_per_day = np.full(count, np.nan)
+    np.divide(growth, days, out=growth_per_day, where=days > 0)
+
+    teams['follower_growth'] = np.empty(count)
+    teams['follower_growth_per_day'] = np.empty(count)
+    teams['follower_growth'][order] = growth
+    teams['follower_growth_per_day'][order] = growth_per_day
+    return teams
+
+
+def compute_metrics(teams: dict) -> dict:
+    """Compute all report metrics on the joined team columns."""
+    teams['followers_per_1k_inhabitants'] = teams['follower'] / teams['population'] * 1000
+    teams['league_rank'] = rank_within_groups(teams['follower'],
+                                              teams['date'],
+                                              teams['league'])
+    teams['division_rank'] = rank_within_groups(teams['follower'],
+                                                teams['date'],
+                                                teams['league'],
+                                                teams['division'])
+    return compute_growth(teams)
+
+
+def format_column(column: np.ndarray) -> np.ndarray:
+    """Format a column as strings, writing missing float values as empty cells."""
+    if np.issubdtype(column.dtype, np.floating):
+        formatted = np.char.mod('%.15g', np.round(column, 3))
+        return np.where(np.isnan(column), '', formatted)
+    return column.astype(str)
+
+
+def export_csv(report: dict, file_path: str):
+    """Export the report columns to a CSV file."""
+    columns = [format_column(report[column]).tolist() for column in REPORT_COLUMNS]
+
+    with open(file_path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(REPORT_COLUMNS)
+        writer.writerows(zip(*columns))
+
+
+def to_arrow_array(name: str, column: np.ndarray):
+    """Convert a report column to an Arrow array, writing missing values as nulls."""
+    if name in INTEGER_COLUMNS:
+        missing = np.isnan(column)
+        return pa.array(np.where(missing, 0, column).astype(np.int64), mask=missing)
+    return pa.array(column, from_pandas=True)
+
+
+def export_parquet(report: dict, file_path: str):
+    """Export the report columns to a Parquet file."""
+    table = pa.table({column: to_arrow_array(column, report[column])
+                        for column in REPORT_COLUMNS})
+    pq.write_table(table, file_path)
+
+
+EXPORTERS = {
+    'csv': export_csv
+}
+
+if pa is not None:
+    EXPORTERS['parquet'] = export_parquet
+
+
+def save_report(report: dict, file_format: str):
+    """Save the report to the report directory."""
+    current_date = datetime.now().strftime(SNAPSHOT_DATE_FORMAT)
+    file_name = f"{current_date}_teams_report.{file_format}"
+
+    report_dir = get_path(DATA_DIR_NAME, REPORT_DIR_NAME)
+    os.makedirs(report_dir, exist_ok=True)
+    file_path = os.path.join(report_dir, file_name)
+
+    EXPORTERS[file_format](report, file_path)
+    logging.info("Report with %s rows saved to '%s'.", report['follower'].shape[0], file_path)
+
+
+def build_report() -> dict:
+    """Load all snapshots, join teams to locations and compute the metrics."""
+    team_metadata = load_team_metadata(CONFIG_FILE_NAME)
+    teams = load_teams(list_snapshots(TEAM_DIR_NAME, 'teams'), team_metadata)
+    locations = load_locations(list_snapshots(LOCATION_DIR_NAME, 'locations'))
+
+    return compute_metrics(join_locations(teams, locations))
+
+
+def main():
+    """Main function to build the report and export it."""
+    parser = argparse.ArgumentParser(description="Report on crawled teams and locations.")
+    parser.add_argument('--format', choices=EXPORTERS.keys(), default='csv',
+                        help="output file format (default: csv)")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    save_report(build_report(), args.format)
+    logging.info("Report built in %.2f seconds.", time.time() - start_time)
+
+
+if __name__ == "__main__":
+    main()
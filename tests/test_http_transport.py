@@ -0,0 +1,105 @@
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from utils.http_transport import (
+    HTTP2_AVAILABLE, HttpTransport, ResponseTooLargeError, TransportStats
+)
+
+BODY = b'<html>ok</html>'
+
+# httpx falls back to HTTP/1.1 over cleartext, so both backends run against the test server
+BACKENDS = [
+    pytest.param(False, id='requests'),
+    pytest.param(True, id='httpx',
+                 marks=pytest.mark.skipif(not HTTP2_AVAILABLE, reason="httpx[http2] missing"))
+]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.send_response(200)
+        if self.path == '/streamed':
+            # No Content-Length, so the size limit is only hit while reading
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            self.wfile.write(f"{len(BODY):x}\r\n".encode() + BODY + b"\r\n0\r\n\r\n")
+        else:
+            self.send_header('Content-Length', str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name="server_urls")
+def fixture_server_urls():
+    servers = [ThreadingHTTPServer(('127.0.0.1', 0), _Handler) for _ in range(3)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+
+    yield [f"http://127.0.0.1:{server.server_address[1]}" for server in servers]
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(name="server_url")
+def fixture_server_url(server_urls):
+    return server_urls[0]
+
+
+@pytest.mark.parametrize('http2', BACKENDS)
+def test_get_returns_content_within_limit(server_url, http2):
+    with HttpTransport(http2=http2, max_response_size=len(BODY)) as transport:
+        response = transport.get(server_url + '/')
+
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.http_version == 'HTTP/1.1'
+
+
+@pytest.mark.parametrize('http2', BACKENDS)
+def test_get_rejects_announced_content_length(server_url, http2):
+    with HttpTransport(http2=http2, max_response_size=10) as transport:
+        with pytest.raises(ResponseTooLargeError, match=f"announces {len(BODY)} bytes"):
+            transport.get(server_url + '/')
+
+
+@pytest.mark.parametrize('http2', BACKENDS)
+def test_get_rejects_streamed_overflow(server_url, http2):
+    with HttpTransport(http2=http2, max_response_size=10) as transport:
+        with pytest.raises(ResponseTooLargeError, match="exceeds 10 bytes"):
+            transport.get(server_url + '/streamed')
+
+
+def test_stats_connections_reused():
+    stats = TransportStats(requests=5, connections_opened=2)
+
+    assert stats.connections_reused == 3
+    assert str(stats) == "5 requests over 2 connections (3 reused)"
+
+
+@pytest.mark.parametrize('http2', BACKENDS)
+def test_get_reuses_keep_alive_connection(server_url, http2):
+    with HttpTransport(http2=http2) as transport:
+        for _ in range(3):
+            transport.get(server_url + '/')
+
+    assert str(transport.stats) == "3 requests over 1 connections (2 reused)"
+
+
+def test_requests_keep_most_recently_used_pool(server_urls):
+    first_url, second_url, third_url = server_urls
+
+    with HttpTransport(http2=False, pool_connections=2) as transport:
+        # The third host evicts the least recently used pool of the second host
+        for url in [first_url, second_url, first_url, third_url, first_url]:
+            transport.get(url + '/')
+
+    assert str(transport.stats) == "5 requests over 3 connections (2 reused)"
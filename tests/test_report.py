@@ -0,0 +1,143 @@
+import logging
+
+import numpy as np
+import pytest
+
+from run_report import (
+    REPORT_COLUMNS, compute_growth, compute_metrics, export_csv, export_parquet,
+    join_locations, load_teams, rank_within_groups
+)
+
+
+def _team_columns(names, dates, follower):
+    return {
+        'name': np.array(names, dtype=str),
+        'date': np.array(dates, dtype='datetime64[D]'),
+        'follower': np.array(follower, dtype=np.float64)
+    }
+
+
+def test_rank_within_groups_gives_ties_the_same_rank():
+    ranks = rank_within_groups(np.array([5.0, 5.0, 3.0]), np.array(['GFL', 'GFL', 'GFL']))
+
+    np.testing.assert_array_equal(ranks, [1, 1, 3])
+
+
+def test_rank_within_groups_ranks_each_group_separately():
+    values = np.array([10.0, 30.0, 20.0, 5.0, 7.0])
+    leagues = np.array(['GFL', 'GFL', 'GFL', 'GFL2', 'GFL2'])
+
+    np.testing.assert_array_equal(rank_within_groups(values, leagues), [3, 1, 2, 2, 1])
+
+
+def test_rank_within_groups_skips_missing_values():
+    values = np.array([np.nan, 10.0, 20.0])
+    ranks = rank_within_groups(values, np.array(['GFL', 'GFL', 'GFL']))
+
+    np.testing.assert_array_equal(ranks, [np.nan, 2, 1])
+
+
+def test_compute_growth_over_snapshot_gaps():
+    teams = compute_growth(_team_columns(
+        ['Comets', 'Comets', 'Comets', 'Razorbacks'],
+        ['2024-08-04', '2024-08-01', '2024-08-02', '2024-08-01'],
+        [130, 100, 110, 50]
+    ))
+
+    np.testing.assert_array_equal(teams['follower_growth'], [20, np.nan, 10, np.nan])
+    np.testing.assert_array_equal(teams['follower_growth_per_day'], [10, np.nan, 10, np.nan])
+
+
+def test_compute_growth_keeps_missing_follower_missing():
+    teams = compute_growth(_team_columns(
+        ['Comets', 'Comets', 'Comets'],
+        ['2024-08-01', '2024-08-02', '2024-08-03'],
+        [100, np.nan, 110]
+    ))
+
+    np.testing.assert_array_equal(teams['follower_growth'], [np.nan, np.nan, np.nan])
+
+
+def test_join_locations_leaves_unmatched_locations_missing():
+    teams = {'location': np.array(['Kempten', 'Atlantis', 'Kempten'])}
+    locations = {
+        'population': np.array([70713.0]),
+        'population_density': np.array([1117.0]),
+        'index': {'Kempten': 0}
+    }
+
+    teams = join_locations(teams, locations)
+
+    np.testing.assert_array_equal(teams['population'], [70713, np.nan, 70713])
+    np.testing.assert_array_equal(teams['population_density'], [1117, np.nan, 1117])
+
+
+def test_join_locations_does_not_report_teams_without_location(caplog):
+    teams = {'location': np.array(['', 'Atlantis', ''])}
+    locations = {
+        'population': np.array([], dtype=np.float64),
+        'population_density': np.array([], dtype=np.float64),
+        'index': {}
+    }
+
+    with caplog.at_level(logging.WARNING):
+        join_locations(teams, locations)
+
+    assert "No location data found for: ['Atlantis']" in caplog.text
+
+
+def _report():
+    teams = _team_columns(['Comets', 'Comets', 'Razorbacks'],
+                          ['2024-08-01', '2024-08-02', '2024-08-01'],
+                          [100, 110, np.nan])
+    for column, value in [('sport', 'American Football'), ('league', 'GFL'), ('division', 'Süd')]:
+        teams[column] = np.full(3, value)
+    teams['location'] = np.array(['Kempten', 'Kempten', 'Atlantis'])
+
+    locations = {
+        'population': np.array([70713.0]),
+        'population_density': np.array([1117.0]),
+        'index': {'Kempten': 0}
+    }
+    return compute_metrics(join_locations(teams, locations))
+
+
+def test_export_csv_writes_missing_values_as_empty_cells(tmp_path):
+    file_path = tmp_path / "report.csv"
+    export_csv(_report(), str(file_path))
+
+    lines = file_path.read_text(encoding='utf-8').splitlines()
+    assert lines[0] == ','.join(REPORT_COLUMNS)
+    assert lines[2].endswith(',110,70713,1117,1.556,1,1,10,10')
+    assert lines[3].endswith(',Atlantis,,,,,,,,')
+
+
+def test_export_parquet_writes_missing_values_as_nulls(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    file_path = tmp_path / "report.parquet"
+    export_parquet(_report(), str(file_path))
+    table = pq.read_table(str(file_path))
+
+    assert table.column_names == REPORT_COLUMNS
+    assert str(table.schema.field('league_rank').type) == 'int64'
+    assert table.column('follower').to_pylist() == [100, 110, None]
+    assert table.column('league_rank').to_pylist() == [1, 1, None]
+    assert table.column('follower_growth').to_pylist() == [None, 10.0, None]
+    assert table.column('population').to_pylist() == [70713.0, 70713.0, None]
+
+
+def test_load_teams_treats_failed_crawls_as_missing(tmp_path):
+    file_path = tmp_path / "20240801_teams_crawl.json"
+    file_path.write_text(
+        '[["Comets", {"profile": "comets", "follower": 0, "posts": 0}],'
+        ' {"name": "Razorbacks", "league": "GFL"},'
+        ' {"name": "Rebels", "instagram": {"follower": 42}}]',
+        encoding='utf-8'
+    )
+
+    teams = load_teams([(np.datetime64('2024-08-01'), str(file_path))],
+                       {'Comets': {'name': 'Comets', 'league': 'GFL'}})
+
+    np.testing.assert_array_equal(teams['follower'], [np.nan, np.nan, 42])
+    np.testing.assert_array_equal(teams['league'], ['GFL', 'GFL', ''])
@@ -0,0 +1,179 @@
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.user_agents import get_random_user_agent
+
+# HTTP/2 requires httpx with its h2 extra ('httpx[http2]' in requirements.txt)
+try:
+    import httpx
+    import h2  # pylint: disable=unused-import
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Constants
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 4
+KEEP_ALIVE_EXPIRY_IN_SECONDS = 30
+CONNECT_TIMEOUT_IN_SECONDS = 5
+READ_TIMEOUT_IN_SECONDS = 20
+MAX_RESPONSE_SIZE_IN_BYTES = 10 * 1024 * 1024
+CHUNK_SIZE_IN_BYTES = 64 * 1024
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when a response body exceeds the configured size limit."""
+
+
+@dataclass
+class TransportResponse:
+    """Data class to hold the parts of a response used by the crawlers."""
+    url: str
+    status_code: int
+    content: bytes
+    http_version: str
+
+
+@dataclass
+class TransportStats:
+    """Data class to hold request and connection counters of a transport."""
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        """Number of requests that were served over an already open connection."""
+        return max(self.requests - self.connections_opened, 0)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.requests} requests over {self.connections_opened} connections "
+            f"({self.connections_reused} reused)"
+        )
+
+
+class HttpTransport:
+    """Class to send GET requests over a pooled, keep-alive connection.
+
+    A single user agent is picked per transport and kept for the lifetime of its
+    connections instead of changing it on every request.
+    """
+
+    def __init__(self,
+                 http2: bool = True,
+                 pool_connections: int = POOL_CONNECTIONS,
+                 pool_maxsize: int = POOL_MAXSIZE,
+                 connect_timeout: float = CONNECT_TIMEOUT_IN_SECONDS,
+                 read_timeout: float = READ_TIMEOUT_IN_SECONDS,
+                 max_response_size: int = MAX_RESPONSE_SIZE_IN_BYTES):
+        self.user_agent = get_random_user_agent()
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.max_response_size = max_response_size
+        self.stats = TransportStats()
+
+        self._lock = threading.Lock()
+        self._connections = weakref.WeakSet()
+        # Both clients keep connections alive by default and HTTP/2 forbids
+        # connection-specific headers, so only the user agent is set
+        headers = {'User-Agent': self.user_agent}
+
+        if self.http2:
+            self._client = httpx.Client(
+                http2=True,
+                headers=headers,
+                follow_redirects=True,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                limits=httpx.Limits(max_connections=pool_connections * pool_maxsize,
+                                    max_keepalive_connections=pool_connections * pool_maxsize,
+                                    keepalive_expiry=KEEP_ALIVE_EXPIRY_IN_SECONDS)
+            )
+        else:
+            self._timeout = (connect_timeout, read_timeout)
+            self._adapter = HTTPAdapter(pool_connections=pool_connections,
+                                        pool_maxsize=pool_maxsize,
+                                        pool_block=True)
+            self._client = requests.Session()
+            self._client.headers.update(headers)
+            self._client.mount('https://', self._adapter)
+            self._client.mount('http://', self._adapter)
+
+        logging.info("HTTP transport uses %s with user agent '%s'",
+                        "HTTP/2" if self.http2 else "HTTP/1.1",
+                        self.user_agent
+                    )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close all pooled connections."""
+        self._client.close()
+
+    def get(self, url: str) -> TransportResponse:
+        """Send a GET request and return the response with its body read."""
+        if self.http2:
+            return self._get_with_httpx(url)
+        return self._get_with_requests(url)
+
+    def log_stats(self):
+        """Log the connection reuse statistics of the transport."""
+        logging.info("HTTP transport: %s", self.stats)
+
+    def _get_with_httpx(self, url: str) -> TransportResponse:
+        with self._client.stream('GET', url) as response:
+            # Multiplexed and kept-alive requests share the same network stream
+            self._count_request(response.extensions.get('network_stream'))
+
+            content = self._read_limited(url,
+                                         response.headers,
+                                         response.iter_bytes(CHUNK_SIZE_IN_BYTES))
+
+            return TransportResponse(url, response.status_code, content, response.http_version)
+
+    def _get_with_requests(self, url: str) -> TransportResponse:
+        with self._client.get(url, timeout=self._timeout, stream=True) as response:
+            # The connection goes back to the pool once the body is read. urllib3
+            # reconnects dropped connections on the same object, so its socket is
+            # what identifies a new connection.
+            connection = response.raw.connection
+            self._count_request(connection.sock if connection is not None else None)
+
+            content = self._read_limited(url,
+                                         response.headers,
+                                         response.iter_content(CHUNK_SIZE_IN_BYTES))
+
+            return TransportResponse(url, response.status_code, content, 'HTTP/1.1')
+
+    def _count_request(self, connection):
+        with self._lock:
+            self.stats.requests += 1
+            if connection is not None and connection not in self._connections:
+                self._connections.add(connection)
+                self.stats.connections_opened += 1
+
+    def _read_limited(self, url: str, headers, chunks) -> bytes:
+        content_length = headers.get('Content-Length')
+        if content_length and content_length.isdigit() \
+                and int(content_length) > self.max_response_size:
+            raise ResponseTooLargeError(
+                f"Response of '{url}' announces {content_length} bytes - "
+                f"limit is {self.max_response_size} bytes."
+            )
+
+        content = bytearray()
+        for chunk in chunks:
+            content.extend(chunk)
+            if len(content) > self.max_response_size:
+                raise ResponseTooLargeError(
+                    f"Response of '{url}' exceeds {self.max_response_size} bytes."
+                )
+
+        return bytes(content)